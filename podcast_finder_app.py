@@ -8,11 +8,21 @@ No coding required - just use the filters and download your results!
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import pandas as pd
+import functools
 import hashlib
+import io
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Page configuration
 st.set_page_config(
     page_title="Podcast Finder Pro",
@@ -22,7 +32,10 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+@st.cache_resource
+def _page_css():
+    """Static page CSS, built once per process and served from cache on reruns"""
+    return """
     <style>
     .main {padding: 2rem;}
     .stButton>button {
@@ -36,15 +49,35 @@ st.markdown("""
     .stButton>button:hover {background-color: #FF6B6B;}
     h1 {color: #FF4B4B;}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+st.markdown(_page_css(), unsafe_allow_html=True)
 
 # Helper Functions
+@functools.lru_cache(maxsize=8)
+def _credential_bytes(api_key, api_secret):
+    """Pre-encode the credential pair so signing never re-encodes it"""
+    return (api_key + api_secret).encode()
+
+@functools.lru_cache(maxsize=8)
+def _sign(api_key, api_secret, bucket):
+    """Compute the auth signature for a 30s time bucket (memoized)
+
+    Podcast Index accepts an X-Auth-Date a few minutes old, so reruns
+    within the same bucket reuse the SHA-1 instead of rehashing. The
+    key+secret prefix is hashed from cached bytes; only the epoch digits
+    are encoded fresh, keeping the hot path to two update calls on a
+    single SHA-1 block.
+    """
+    epoch_time = bucket * 30
+    sha = hashlib.sha1(_credential_bytes(api_key, api_secret))
+    sha.update(str(epoch_time).encode())
+    return epoch_time, sha.hexdigest()
+
 def get_podcast_index_headers(api_key, api_secret):
     """Generate authentication headers for Podcast Index API"""
-    epoch_time = int(time.time())
-    data_to_hash = api_key + api_secret + str(epoch_time)
-    sha_1 = hashlib.sha1(data_to_hash.encode()).hexdigest()
-    
+    epoch_time, sha_1 = _sign(api_key, api_secret, int(time.time()) // 30)
+
     return {
         'X-Auth-Date': str(epoch_time),
         'X-Auth-Key': api_key,
@@ -52,131 +85,335 @@ def get_podcast_index_headers(api_key, api_secret):
         'User-Agent': 'PodcastFinderPro/1.0'
     }
 
-def search_podcasts(api_key, api_secret, max_results=1000, days_back=365):
-    """Search for podcasts from Podcast Index - always search wide, filter later"""
+def parse_response_json(response):
+    """Decode an API response body, via orjson when available (2-3x faster)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+@st.cache_resource
+def get_http_session():
+    """Shared keep-alive session so searches reuse pooled TLS connections
+
+    One session per process (st.cache_resource), sized to match the page
+    fetch thread pool, with a couple of backed-off retries for flaky
+    connections.
+    """
+    sess = requests.Session()
+    sess.headers['User-Agent'] = 'PodcastFinderPro/1.0'
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    sess.mount('https://', adapter)
+    return sess
+
+def hash_api_key(api_key):
+    """Hash the API key so raw credentials never end up in cache keys"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+def _fetch_feed_pages(url, headers, param_pages, target=None):
+    """Fetch several result pages concurrently and merge their feeds
+
+    Each page flight is independent and network-bound, so a small thread
+    pool collapses wall time to roughly the slowest page. Feeds are
+    deduplicated by id since pages can overlap (e.g. one feed matching
+    several search terms). With a target, pages go out in waves and
+    fetching stops as soon as that many unique feeds have accumulated -
+    later pages are never paid for.
+    """
+    sess = get_http_session()
+
+    def fetch(params):
+        response = sess.get(url, headers=headers, params=params, timeout=30)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP Error {response.status_code}")
+        data = parse_response_json(response)
+        if data.get('status') != 'true':
+            raise RuntimeError(f"API Error: {data.get('description', 'Unknown error')}")
+        return data.get('feeds', [])
+
+    if len(param_pages) == 1:
+        feeds = fetch(param_pages[0])
+        return feeds[:target] if target else feeds
+
+    feeds = []
+    seen = set()
+    wave_size = 4 if target else len(param_pages)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for start in range(0, len(param_pages), wave_size):
+            wave = param_pages[start:start + wave_size]
+            for page in executor.map(fetch, wave):
+                for feed in page:
+                    feed_id = feed.get('id')
+                    if feed_id not in seen:
+                        seen.add(feed_id)
+                        feeds.append(feed)
+            if target and len(feeds) >= target:
+                break
+    return feeds[:target] if target else feeds
+
+@st.cache_data(ttl=600, show_spinner=False)
+def search_podcasts(api_key_hash, _api_key, _api_secret, max_results=1000, days_back=365):
+    """Search for podcasts from Podcast Index - always search wide, filter later
+
+    Cached for 10 minutes keyed on (api_key_hash, max_results, days_back).
+    The raw credentials are underscore-prefixed so Streamlit never hashes them.
+    Raises on any API or connection failure - Streamlit does not cache
+    exceptions, so only successful feed lists enter the cache and the next
+    click after a blip retries the network.
+    """
     base_url = "https://api.podcastindex.org/api/1.0"
     # Always search for a wide timeframe (1 year) and filter later
     since_timestamp = int((datetime.now() - timedelta(days=days_back)).timestamp())
-    
+
     url = f"{base_url}/recent/feeds"
+    headers = get_podcast_index_headers(_api_key, _api_secret)
+
+    # /recent/feeds always returns the newest feeds past `since`, so there
+    # is no way to slice it into disjoint pages - one request at the
+    # endpoint's full max is both correct and fastest here. The parallel
+    # fan-out stays on the byterm path, where pages really are disjoint.
     params = {'since': since_timestamp, 'max': max_results}
-    headers = get_podcast_index_headers(api_key, api_secret)
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('status') == 'true':
-                return data.get('feeds', []), None
-            else:
-                return [], f"API Error: {data.get('description', 'Unknown error')}"
-        else:
-            return [], f"HTTP Error {response.status_code}"
-    except Exception as e:
-        return [], f"Connection Error: {str(e)}"
-
-def search_by_term(api_key, api_secret, search_term):
-    """Search podcasts by keyword/term"""
+
+    return _prune_feeds(_fetch_feed_pages(url, headers, [params], target=max_results))
+
+@st.cache_data(ttl=600, show_spinner=False)
+def search_by_term(api_key_hash, _api_key, _api_secret, search_term):
+    """Search podcasts by keyword/term (cached for 10 minutes per term)
+
+    Comma-separated terms are searched concurrently - each term is an
+    independent network-bound request, so the shared thread pool brings
+    wall time down to roughly the slowest term. Feeds appearing under
+    several terms are deduplicated by id. Raises on any API or connection
+    failure so errors are never cached - only successful results are.
+    """
     base_url = "https://api.podcastindex.org/api/1.0"
     url = f"{base_url}/search/byterm"
-    params = {'q': search_term, 'max': 1000}
-    headers = get_podcast_index_headers(api_key, api_secret)
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('status') == 'true':
-                return data.get('feeds', []), None
-            else:
-                return [], f"API Error: {data.get('description', 'Unknown error')}"
-        else:
-            return [], f"HTTP Error {response.status_code}"
-    except Exception as e:
-        return [], f"Connection Error: {str(e)}"
+    terms = [t.strip() for t in search_term.split(',') if t.strip()] or [search_term]
+    headers = get_podcast_index_headers(_api_key, _api_secret)
+    param_pages = [{'q': term, 'max': 1000} for term in terms]
+
+    return _prune_feeds(_fetch_feed_pages(url, headers, param_pages))
+
+# Country option -> language-code token its mask looks for
+# (US additionally accepts a bare 'en')
+COUNTRY_LANG_TOKENS = {
+    'US': 'en-us',
+    'UK': 'en-gb',
+    'Canada': 'en-ca',
+    'Australia': 'en-au',
+}
+
+@functools.lru_cache(maxsize=32)
+def _category_pattern(filter_cats):
+    """Compile one alternation regex for a set of category filters (memoized)"""
+    return re.compile('|'.join(map(re.escape, filter_cats)))
 
 def filter_podcasts(podcasts, min_episodes, max_days_since_post, created_within_days,
                    languages, exclude_explicit, categories_filter, country_filter):
-    """Filter podcasts based on Jaquory's criteria"""
-    cutoff_timestamp = int((datetime.now() - timedelta(days=max_days_since_post)).timestamp())
-    created_cutoff = int((datetime.now() - timedelta(days=created_within_days)).timestamp()) if created_within_days > 0 else 0
-    
-    filtered = []
-    
-    for podcast in podcasts:
-        # Amount of posts (episode count filter)
-        episode_count = podcast.get('episodeCount', 0)
-        if episode_count < min_episodes:
-            continue
-        
-        # Language filter
-        if languages:
-            podcast_language = podcast.get('language', '').lower()
-            if podcast_language not in [lang.lower() for lang in languages]:
-                continue
-        
-        # Explicit content filter
-        if exclude_explicit and podcast.get('explicit', False):
-            continue
-        
-        # Date of last post filter
-        last_update = podcast.get('lastUpdateTime', 0)
-        if last_update < cutoff_timestamp:
-            continue
-        
-        # When podcast was created filter
-        if created_within_days > 0:
-            date_added = podcast.get('dateAdded', 0)
-            if date_added > 0 and date_added < created_cutoff:
-                continue
-        
-        # Country filter (basic - based on language codes)
-        if country_filter != 'Any':
-            podcast_language = podcast.get('language', '').lower()
-            if country_filter == 'US' and 'en-us' not in podcast_language and podcast_language != 'en':
-                continue
-            elif country_filter == 'UK' and 'en-gb' not in podcast_language:
-                continue
-            elif country_filter == 'Canada' and 'en-ca' not in podcast_language:
-                continue
-            elif country_filter == 'Australia' and 'en-au' not in podcast_language:
-                continue
-        
-        # Category filter
-        if categories_filter:
-            podcast_categories = [cat.lower() for cat in podcast.get('categories', {}).values()]
-            if not any(filter_cat.lower() in cat for filter_cat in categories_filter for cat in podcast_categories):
-                continue
-        
-        filtered.append(podcast)
-    
-    return filtered
+    """Filter podcasts based on Jaquory's criteria (vectorized boolean masks)
+
+    Returns a DataFrame of the surviving raw feeds rather than a Python list -
+    every criterion is a NumPy-backed mask instead of a per-podcast loop.
+    """
+    # Plain epoch arithmetic - no datetime/timedelta objects on this path
+    now_ts = int(time.time())
+    cutoff_timestamp = now_ts - max_days_since_post * 86400
+    created_cutoff = now_ts - created_within_days * 86400 if created_within_days > 0 else 0
+    languages_lc = {lang.lower() for lang in languages}
+    filter_cats_lc = [cat.lower() for cat in categories_filter]
+
+    df = pd.DataFrame(podcasts)
+    if df.empty:
+        return df
+    for field in ('episodeCount', 'language', 'explicit', 'lastUpdateTime', 'dateAdded', 'categories'):
+        if field not in df.columns:
+            df[field] = None
+
+    # Cheap, selective integer cutoffs first: the recency cutoff typically
+    # rejects most rows, so narrow the frame before any string-mask work
+    mask = df['lastUpdateTime'].fillna(0) >= cutoff_timestamp
+
+    # Amount of posts (episode count filter)
+    mask &= df['episodeCount'].fillna(0) >= min_episodes
+
+    # When podcast was created filter
+    if created_within_days > 0:
+        date_added = df['dateAdded'].fillna(0)
+        mask &= (date_added == 0) | (date_added >= created_cutoff)
+
+    df = df[mask]
+    if df.empty:
+        return df
+    mask = pd.Series(True, index=df.index)
+
+    # Explicit content filter
+    if exclude_explicit:
+        mask &= ~df['explicit'].fillna(False).astype(bool)
+
+    # One lowercase pass over the language column feeds both masks below
+    country_token = COUNTRY_LANG_TOKENS.get(country_filter)
+    if languages or country_token:
+        lang_lc = df['language'].fillna('').str.lower()
+
+    # Language filter
+    if languages:
+        mask &= lang_lc.isin(languages_lc)
+
+    # Country filter (basic - based on language codes)
+    if country_token:
+        country_mask = lang_lc.str.contains(country_token, regex=False)
+        if country_filter == 'US':
+            country_mask |= lang_lc == 'en'
+        mask &= country_mask
+
+    # Category filter
+    if categories_filter:
+        # ' | ' separator keeps a filter term from matching across the
+        # boundary of two adjacent category names
+        cats_joined = df['categories'].map(
+            lambda d: ' | '.join(d.values()).lower() if isinstance(d, dict) else '')
+        mask &= cats_joined.str.contains(_category_pattern(tuple(filter_cats_lc)))
+
+    return df[mask]
+
+# Raw API field -> display column name
+COLUMN_MAP = {
+    'title': 'Title',
+    'author': 'Author',
+    'ownerName': 'Owner',
+    'email': 'Email',
+    'link': 'Website',
+    'url': 'Feed URL',
+    'episodeCount': 'Episodes',
+    'language': 'Language',
+    'categories': 'Categories',
+    'lastUpdateTime': 'Last Updated',
+    'dateAdded': 'Created',
+    'itunesId': 'iTunes ID',
+    'explicit': 'Explicit',
+    'description': 'Description',
+    'image': 'Image',
+}
+
+# Fields retained from the API payload; the raw feeds carry many more
+# (funding, value blocks, guids, ...) that the app never displays
+KEEP_FIELDS = ('id',) + tuple(COLUMN_MAP)
+
+def _prune_feeds(feeds):
+    """Drop unused API fields so cached/stored feeds stay small"""
+    return [{k: f.get(k) for k in KEEP_FIELDS} for f in feeds]
 
 def extract_podcast_data(podcasts):
-    """Extract and format podcast data for display"""
-    results = []
-    
-    for podcast in podcasts:
-        result = {
-            'Title': podcast.get('title', 'Unknown'),
-            'Author': podcast.get('author', ''),
-            'Owner': podcast.get('ownerName', ''),
-            'Email': podcast.get('email', ''),
-            'Website': podcast.get('link', ''),
-            'Feed URL': podcast.get('url', ''),
-            'Episodes': podcast.get('episodeCount', 0),
-            'Language': podcast.get('language', ''),
-            'Categories': ', '.join([cat for cat in podcast.get('categories', {}).values()]),
-            'Last Updated': datetime.fromtimestamp(podcast.get('lastUpdateTime', 0)).strftime('%Y-%m-%d'),
-            'Created': datetime.fromtimestamp(podcast.get('dateAdded', 0)).strftime('%Y-%m-%d') if podcast.get('dateAdded') else '',
-            'iTunes ID': podcast.get('itunesId', ''),
-            'Explicit': 'Yes' if podcast.get('explicit', False) else 'No',
-            'Description': podcast.get('description', '')[:200] + '...' if len(podcast.get('description', '')) > 200 else podcast.get('description', ''),
-            'Image': podcast.get('image', '')
-        }
-        results.append(result)
-    
-    return pd.DataFrame(results)
+    """Extract and format podcast data for display (vectorized, no Python row loop)"""
+    # from_records/reindex with explicit columns does the column-oriented
+    # conversion in C, guarantees every expected field exists and drops the
+    # rest (e.g. the id kept for dedupe) in the same step
+    if isinstance(podcasts, pd.DataFrame):
+        df = podcasts.reindex(columns=list(COLUMN_MAP)).reset_index(drop=True)
+    else:
+        df = pd.DataFrame.from_records(podcasts, columns=list(COLUMN_MAP))
+
+    df['title'] = df['title'].fillna('Unknown')
+    df['episodeCount'] = df['episodeCount'].fillna(0).astype(int)
+
+    # Columnar timestamp -> date string conversion (one C loop per column)
+    df['lastUpdateTime'] = pd.to_datetime(df['lastUpdateTime'], unit='s', errors='coerce').dt.strftime('%Y-%m-%d').fillna('')
+    date_added = pd.to_datetime(df['dateAdded'].replace(0, None), unit='s', errors='coerce')
+    df['dateAdded'] = date_added.dt.strftime('%Y-%m-%d').fillna('')
+
+    df['categories'] = df['categories'].map(lambda d: ', '.join(d.values()) if isinstance(d, dict) else '')
+    df['explicit'] = df['explicit'].map({True: 'Yes'}).fillna('No')
+
+    description = df['description'].fillna('')
+    truncated = description.str.slice(0, 200) + '...'
+    df['description'] = truncated.where(description.str.len() > 200, description)
+
+    # Nullable Int64 keeps IDs as integers instead of floats when some are missing
+    df['itunesId'] = df['itunesId'].astype('Int64').astype(object).fillna('')
+    for field in ('author', 'ownerName', 'email', 'link', 'url', 'language', 'image'):
+        df[field] = df[field].fillna('')
+
+    # Low-cardinality columns as category dtype: int codes + one small string
+    # table instead of a Python str per cell, and value_counts on codes
+    df['language'] = df['language'].astype('category')
+    df['explicit'] = df['explicit'].astype('category')
+
+    return df[list(COLUMN_MAP)].rename(columns=COLUMN_MAP)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_results_df(podcasts, min_episodes, max_days_since_post, created_within_days,
+                     languages, exclude_explicit, categories_filter, country_filter):
+    """Filter raw feeds and format the survivors in one DataFrame pipeline
+    (cached on the feed list and the full filter tuple)
+
+    The feed list is converted to a DataFrame exactly once (inside
+    filter_podcasts); the display formatting then runs only on the rows
+    that survived, so dropped feeds never pay the datetime/category/
+    description conversion cost.
+    """
+    filtered = filter_podcasts(podcasts, min_episodes, max_days_since_post,
+                               created_within_days, languages, exclude_explicit,
+                               categories_filter, country_filter)
+    if filtered.empty:
+        return pd.DataFrame(columns=list(COLUMN_MAP.values()))
+    return extract_podcast_data(filtered)
+
+@st.cache_data(show_spinner=False)
+def summarize_results(df):
+    """Aggregate the headline metrics in one agg pass (cached across reruns)"""
+    # Missing Email/Author values are empty strings after extraction, not NaN
+    non_empty = lambda s: s.ne('').sum()
+    stats = df.agg({'Episodes': 'mean', 'Email': non_empty, 'Author': non_empty})
+    return {
+        'total': len(df),
+        'avg_episodes': float(stats['Episodes']),
+        'with_email': int(stats['Email']),
+        'with_author': int(stats['Author']),
+    }
+
+@st.cache_data(show_spinner=False)
+def df_to_csv_bytes(df):
+    """Encode a results DataFrame as CSV bytes (cached on DataFrame contents)"""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
+
+@st.fragment
+def render_results(df):
+    """Results section - a fragment, so column-selection and download clicks
+    rerun only this block instead of the whole script (sidebar, search, filter)"""
+    st.markdown("---")
+    st.header(f"📊 Results: {len(df)} Podcasts")
+
+    stats = summarize_results(df)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total", stats['total'])
+    with col2:
+        st.metric("Avg Episodes", f"{stats['avg_episodes']:.0f}")
+    with col3:
+        st.metric("With Email", stats['with_email'])
+    with col4:
+        st.metric("With Author", stats['with_author'])
+
+    st.markdown("---")
+
+    # Display
+    default_cols = ['Title', 'Author', 'Email', 'Episodes', 'Last Updated', 'Categories']
+    selected_cols = st.multiselect("Select Columns", df.columns.tolist(), default=default_cols)
+
+    if selected_cols:
+        st.dataframe(df[selected_cols], use_container_width=True, height=400)
+
+        # Download
+        st.markdown("---")
+        st.subheader("📥 Download")
+        st.download_button(
+            "📄 Download CSV",
+            df_to_csv_bytes(df),
+            f"podcasts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            "text/csv"
+        )
 
 # Main App
 def main():
@@ -210,9 +447,10 @@ def main():
         # Search
         st.subheader("🔍 Search")
         search_term = st.text_input(
-            "Search Term", 
+            "Search Term",
             placeholder="business, technology, health...",
-            help="Search for podcasts by keyword, topic, or category"
+            help="Search for podcasts by keyword, topic, or category - "
+                 "comma-separate several terms to search them all at once"
         )
         
         st.markdown("---")
@@ -250,7 +488,7 @@ def main():
         # Location filter
         country_filter = st.selectbox(
             "Country (Optional)",
-            options=['Any', 'US', 'UK', 'Canada', 'Australia'],
+            options=['Any'] + list(COUNTRY_LANG_TOKENS),
             index=0,
             help="Filter by country - based on language and metadata"
         )
@@ -277,77 +515,89 @@ def main():
         
         st.markdown("---")
         search_button = st.button("🔍 Search Podcasts", type="primary")
+
+        if st.button("🧹 Clear Cached Results", help="Force fresh results from the API"):
+            st.cache_data.clear()
+            st.session_state.pop("raw_feeds", None)
+            st.session_state.pop("df", None)
+            st.session_state.pop("filter_key", None)
+            st.success("✅ Cache cleared")
     
+    # The full filter configuration - when this changes, results need refiltering
+    filter_key = (
+        search_term, min_episodes, max_days_since_post, created_within_days,
+        tuple(languages), exclude_explicit, tuple(categories_filter), country_filter
+    )
+    st.session_state.setdefault("filter_key", None)
+
     # Main Content
     if search_button:
         if not search_term or not search_term.strip():
             st.error("⚠️ Please enter a search term (e.g., business, technology, sports)")
             st.stop()
-        
+
         with st.spinner("🔍 Searching..."):
-            podcasts, error = search_by_term(api_key, api_secret, search_term)
-            
-            if error:
-                st.error(f"❌ {error}")
+            try:
+                podcasts = search_by_term(hash_api_key(api_key), api_key, api_secret, search_term)
+            except Exception as e:
+                msg = str(e)
+                if not msg.startswith(('API Error', 'HTTP Error')):
+                    msg = f"Connection Error: {msg}"
+                st.error(f"❌ {msg}")
                 st.stop()
-            
+
             if not podcasts:
                 st.warning(f"⚠️ No podcasts found for '{search_term}'")
                 st.stop()
-            
+
             st.success(f"✅ Found {len(podcasts)} podcasts for '{search_term}'")
-        
+
         with st.spinner("🎯 Filtering..."):
-            filtered = filter_podcasts(
-                podcasts, 
-                min_episodes, 
+            df = build_results_df(
+                podcasts,
+                min_episodes,
                 max_days_since_post,
                 created_within_days,
-                languages, 
-                exclude_explicit, 
+                languages,
+                exclude_explicit,
                 categories_filter,
                 country_filter
             )
-            
-            if not filtered:
+
+            if df.empty:
                 st.warning("⚠️ No matches. Relax filters.")
                 st.stop()
-            
-            df = extract_podcast_data(filtered)
-        
-        # Results
-        st.markdown("---")
-        st.header(f"📊 Results: {len(df)} Podcasts")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total", len(df))
-        with col2:
-            st.metric("Avg Episodes", f"{df['Episodes'].mean():.0f}")
-        with col3:
-            st.metric("With Email", df['Email'].notna().sum())
-        with col4:
-            st.metric("With Author", df['Author'].notna().sum())
-        
-        st.markdown("---")
-        
-        # Display
-        default_cols = ['Title', 'Author', 'Email', 'Episodes', 'Last Updated', 'Categories']
-        selected_cols = st.multiselect("Select Columns", df.columns.tolist(), default=default_cols)
-        
-        if selected_cols:
-            st.dataframe(df[selected_cols], use_container_width=True, height=400)
-            
-            # Download
-            st.markdown("---")
-            st.subheader("📥 Download")
-            csv = df.to_csv(index=False)
-            st.download_button(
-                "📄 Download CSV",
-                csv,
-                f"podcasts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                "text/csv"
+
+        # Persist so column-select / download reruns don't re-hit the API
+        st.session_state["raw_feeds"] = podcasts
+        st.session_state["df"] = df
+        st.session_state["filter_key"] = filter_key
+
+    # Filter tweaks after a search reuse the stored raw feeds - pure pandas
+    # work on data already fetched, no API round-trip
+    elif "raw_feeds" in st.session_state and filter_key != st.session_state["filter_key"]:
+        with st.spinner("🎯 Filtering..."):
+            df = build_results_df(
+                st.session_state["raw_feeds"],
+                min_episodes,
+                max_days_since_post,
+                created_within_days,
+                languages,
+                exclude_explicit,
+                categories_filter,
+                country_filter
             )
+
+        if df.empty:
+            st.warning("⚠️ No matches. Relax filters.")
+            st.stop()
+
+        st.session_state["df"] = df
+        st.session_state["filter_key"] = filter_key
+
+    # Results (rendered from session state so widget reruns are free)
+    if "df" in st.session_state:
+        render_results(st.session_state["df"])
     else:
         st.info("""
         ### 👋 Welcome to Podcast Finder Pro!